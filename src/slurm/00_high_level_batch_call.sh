@@ -1,5 +1,19 @@
 ID=`pwd`
 ID=`basename $ID`
 echo $ID
+# ANTPD_JOB_MODE=subject runs one subject (all sessions) per array task, so
+# the array is sized from the number of subjects under ANTPD_BIDS_ROOT.
+# set ANTPD_ARRAY to override the range in either mode.
+ARRAY=${ANTPD_ARRAY:-0-50}
+if [ "${ANTPD_JOB_MODE}" = "subject" ] && [ -z "${ANTPD_ARRAY}" ]; then
+  BIDS=${ANTPD_BIDS_ROOT:-/mnt/cluster/data/ANTPD/bids}
+  NSUB=`ls ${BIDS}/*/*/anat/*T1w.nii.gz | xargs -n1 basename | grep _ | cut -d_ -f1 | sort -u | wc -l`
+  if [ "$NSUB" -lt 1 ]; then
+    echo "no subjects found under ${BIDS}"
+    exit 1
+  fi
+  ARRAY=0-$((NSUB-1))
+fi
+echo array is $ARRAY
 sbatch  --export=ALL --cpus-per-task 24  -o ~/slurmout/${ID}.%a.out  \
-  --array=0-50  /mnt/cluster/data/${ID}/src/slurm/01_job_id_subscript.sh
+  --array=${ARRAY}  /mnt/cluster/data/${ID}/src/slurm/01_job_id_subscript.sh
@@ -14,16 +14,29 @@ Where root_or_bids_dir can be:
   - /path/to/ANTPD              (contains bids/)
   - /path/to/ANTPD/bids         (is bids root)
   - /path/to/ANTPD/bids/sub-... (inside bids tree)
+
+Job modes (set via ANTPD_JOB_MODE):
+  - session (default): one T1 per job; file_index indexes T1w files and
+    sub-XXXX selects that subject's first T1.
+  - subject: all sessions of one subject in a single process; file_index
+    indexes subjects.  This only saves process start-up (Python imports and
+    the template load): mm_csv offers no way to share per-subject work, so
+    every session still runs its own segmentation, registrations and model
+    loads.  A timing summary is printed at the end.
 """
 
 from __future__ import annotations
 
+import time
+_PROCESS_START = time.perf_counter()
+
 import os
 os.environ.setdefault("MPLBACKEND", "Agg")
 import matplotlib
 matplotlib.use("Agg")
 import glob
 import sys
+import traceback
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -32,6 +45,8 @@ import ants
 import antspyt1w
 import antspymm
 
+_STARTUP_SECONDS = time.perf_counter() - _PROCESS_START
+
 
 # -----------------------------
 # Config / constants
@@ -50,6 +65,12 @@ TEMPLATE_DIR = Path.home() / ".antspymm"
 TEMPLATE_IMAGE = TEMPLATE_DIR / "PPMI_template0.nii.gz"
 TEMPLATE_MASK = TEMPLATE_DIR / "PPMI_template0_brainmask.nii.gz"
 
+NORMALIZATION_TEMPLATE_SPACING = [1, 1, 1]
+
+JOB_MODE_SESSION = "session"
+JOB_MODE_SUBJECT = "subject"
+JOB_MODES = (JOB_MODE_SESSION, JOB_MODE_SUBJECT)
+
 
 @dataclass(frozen=True)
 class RunPaths:
@@ -59,6 +80,14 @@ class RunPaths:
     csvoutdir: Path
 
 
+@dataclass(frozen=True)
+class SessionResult:
+    subject_id: str
+    subdate: str
+    seconds: float
+    ok: bool
+
+
 # -----------------------------
 # Utility helpers
 # -----------------------------
@@ -256,25 +285,54 @@ def find_optional_modalities(bids_root: Path, subject_id: str, subdate: str) ->
     return dtfn, rsfn
 
 
-def run_pipeline(paths: RunPaths, fileindex: Optional[int], subject_id: Optional[str], template: ants.ANTsImage) -> None:
-    t1_files = list_t1_files(paths.bids_root)
-    if not t1_files:
-        die(f"No T1w files found under: {paths.bids_root}")
-
+def select_session_t1(t1_files: List[Path], fileindex: Optional[int], subject_id: Optional[str]) -> Path:
     if subject_id:
         subject_matches = [p for p in t1_files if p.name.startswith(subject_id)]
         if not subject_matches:
             die(f"No T1w files found for subject: {subject_id}")
         t1fn = sorted(subject_matches)[0]
         info(f"Selected first T1 for subject {subject_id}: {t1fn}")
-    else:
+        return t1fn
+
+    if fileindex is None:
+        fileindex = DEFAULT_FILEINDEX
+    if fileindex < 0 or fileindex >= len(t1_files):
+        die(f"File index out of range: {fileindex} (found {len(t1_files)} T1w files)")
+    t1fn = t1_files[fileindex]
+    info(f"Selected T1 file [{fileindex}/{len(t1_files)-1}]: {t1fn}")
+    return t1fn
+
+
+def select_subject_t1s(t1_files: List[Path], fileindex: Optional[int], subject_id: Optional[str]) -> List[Path]:
+    """
+    In subject mode the integer selector indexes sorted unique subjects, so an
+    array of 0..n_subjects-1 covers the cohort.
+    """
+    parseable = []
+    for p in t1_files:
+        if len(p.name.split("_")) < 2:
+            info(f"Note: skipping unexpected T1 filename: {p}")
+            continue
+        parseable.append(p)
+    subjects = sorted({parse_subject_session_from_t1(p)[0] for p in parseable})
+
+    if not subject_id:
         if fileindex is None:
             fileindex = DEFAULT_FILEINDEX
-        if fileindex < 0 or fileindex >= len(t1_files):
-            die(f"File index out of range: {fileindex} (found {len(t1_files)} T1w files)")
-        t1fn = t1_files[fileindex]
-        info(f"Selected T1 file [{fileindex}/{len(t1_files)-1}]: {t1fn}")
+        if fileindex < 0 or fileindex >= len(subjects):
+            die(f"Subject index out of range: {fileindex} (found {len(subjects)} subjects)")
+        subject_id = subjects[fileindex]
+        info(f"Selected subject [{fileindex}/{len(subjects)-1}]: {subject_id}")
+
+    subject_t1s = sorted(p for p in parseable if parse_subject_session_from_t1(p)[0] == subject_id)
+    if not subject_t1s:
+        die(f"No T1w files found for subject: {subject_id}")
+    info(f"Found {len(subject_t1s)} session(s) for subject {subject_id}")
+    return subject_t1s
+
 
+def run_session(paths: RunPaths, t1fn: Path, template: ants.ANTsImage) -> SessionResult:
+    start = time.perf_counter()
     subject_id, subdate = parse_subject_session_from_t1(t1fn)
     info(f"RUN: subject = {subject_id}, session = {subdate}")
 
@@ -306,7 +364,7 @@ def run_pipeline(paths: RunPaths, fileindex: Optional[int], subject_id: Optional
         normalization_template=template,
         normalization_template_output="ppmi",
         normalization_template_transform_type="antsRegistrationSyNQuickRepro[s]",
-        normalization_template_spacing=[1, 1, 1],
+        normalization_template_spacing=NORMALIZATION_TEMPLATE_SPACING,
         srmodel_T1=None,
         srmodel_NM=None,
         srmodel_DTI=None,
@@ -314,6 +372,61 @@ def run_pipeline(paths: RunPaths, fileindex: Optional[int], subject_id: Optional
     )
 
     info("Multimodal processing complete.")
+    return SessionResult(subject_id, subdate, time.perf_counter() - start, True)
+
+
+def run_pipeline(paths: RunPaths, fileindex: Optional[int], subject_id: Optional[str], template: ants.ANTsImage) -> None:
+    t1_files = list_t1_files(paths.bids_root)
+    if not t1_files:
+        die(f"No T1w files found under: {paths.bids_root}")
+
+    t1fn = select_session_t1(t1_files, fileindex, subject_id)
+    run_session(paths, t1fn, template)
+
+
+def report_subject_timing(results: List[SessionResult]) -> None:
+    """
+    The saving is an estimate, not a measurement: it assumes each independent
+    run would repeat this process's module imports.  The template load is also
+    shared but not counted, and no per-session processing is shared at all.
+    """
+    saved = (len(results) - 1) * _STARTUP_SECONDS
+
+    info("Subject timing summary:")
+    for r in results:
+        status = "ok" if r.ok else "FAILED"
+        info(f"  {r.subject_id} {r.subdate}: {r.seconds:.1f}s ({status})")
+    info(f"  process start-up:          {_STARTUP_SECONDS:.1f}s")
+    info(f"  total wall time:           {time.perf_counter() - _PROCESS_START:.1f}s")
+    info(f"  saved vs. independent runs (estimate): {saved:.1f}s")
+
+
+def run_subject(
+    paths: RunPaths,
+    fileindex: Optional[int],
+    subject_id: Optional[str],
+    template: ants.ANTsImage,
+) -> None:
+    t1_files = list_t1_files(paths.bids_root)
+    if not t1_files:
+        die(f"No T1w files found under: {paths.bids_root}")
+
+    results: List[SessionResult] = []
+    for t1fn in select_subject_t1s(t1_files, fileindex, subject_id):
+        start = time.perf_counter()
+        try:
+            results.append(run_session(paths, t1fn, template))
+        except Exception:
+            # keep going so one bad session does not cost the others
+            traceback.print_exc()
+            sid, subdate = parse_subject_session_from_t1(t1fn)
+            results.append(SessionResult(sid, subdate, time.perf_counter() - start, False))
+
+    report_subject_timing(results)
+
+    failed = [r.subdate for r in results if not r.ok]
+    if failed:
+        die(f"{len(failed)} session(s) failed: {', '.join(failed)}")
 
 
 def main(argv: List[str]) -> None:
@@ -322,15 +435,24 @@ def main(argv: List[str]) -> None:
     num_threads = int(os.environ.get("ANTPD_NUM_THREADS", str(DEFAULT_THREAD_COUNT)))
     set_thread_env(num_threads)
 
+    job_mode = os.environ.get("ANTPD_JOB_MODE", JOB_MODE_SESSION).lower()
+    if job_mode not in JOB_MODES:
+        die(f"ANTPD_JOB_MODE must be one of {', '.join(JOB_MODES)}; got: {job_mode}", 2)
+
     paths = resolve_paths(user_rootdir)
     info(f"Using base_directory: {paths.base_directory}")
     info(f"Using bids_root:       {paths.bids_root}")
     info(f"Using outdir:          {paths.outdir}")
     info(f"Using csvoutdir:       {paths.csvoutdir}")
     info(f"Threads:              {num_threads} (override via ANTPD_NUM_THREADS)")
+    info(f"Job mode:             {job_mode} (override via ANTPD_JOB_MODE)")
 
     template = ensure_template()
-    run_pipeline(paths, fileindex, subject_id, template)
+
+    if job_mode == JOB_MODE_SUBJECT:
+        run_subject(paths, fileindex, subject_id, template)
+    else:
+        run_pipeline(paths, fileindex, subject_id, template)
 
 
 if __name__ == "__main__":